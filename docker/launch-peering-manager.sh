@@ -41,6 +41,27 @@ load_configuration() {
   fi
 
   echo "✅ Unit configuration loaded successfully"
+
+  # Optionally restart application processes after they served a given number of
+  # requests, e.g. to release memory grown by very large API responses
+  if [ -n "${UNIT_MAX_REQUESTS}" ]; then
+    RESP_CODE=$(
+      curl \
+        --silent \
+        --output /dev/null \
+        --write-out '%{http_code}' \
+        --request PUT \
+        --data "{\"requests\": ${UNIT_MAX_REQUESTS}}" \
+        --unix-socket $UNIT_SOCKET \
+        http://localhost/config/applications/peeringmanager/limits
+    )
+    if [ "${RESP_CODE}" != "200" ]; then
+      echo "⚠️  Could not apply UNIT_MAX_REQUESTS=${UNIT_MAX_REQUESTS}"
+      return 1
+    fi
+
+    echo "✅ Application processes restart after ${UNIT_MAX_REQUESTS} requests"
+  fi
 }
 
 load_configuration &
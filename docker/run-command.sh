@@ -1,9 +1,50 @@
 #!/bin/bash
 SLEEP_SECONDS=${COMMAND_INTERVAL:=86400}
 
-echo "Interval set to ${SLEEP_SECONDS} seconds"
+# Run the command every day at the given time of the day (HH:MM or HH:MM:SS) instead
+# of every COMMAND_INTERVAL seconds starting from the container start, so that heavy
+# commands are run during a quiet period. COMMAND_INTERVAL is ignored in that case.
+# The image does not ship timezone data: the time is in UTC unless TZ is set to a
+# POSIX TZ string (e.g. CET-1CEST,M3.5.0,M10.5.0/3), zone names such as Europe/Paris
+# are not available.
+if [ -n "${COMMAND_START_TIME}" ]; then
+  if ! [[ "${COMMAND_START_TIME}" =~ ^([01][0-9]|2[0-3]):[0-5][0-9](:[0-5][0-9])?$ ]]; then
+    echo "❌ Invalid COMMAND_START_TIME '${COMMAND_START_TIME}', expected a time like '03:00'"
+    exit 1
+  fi
+  echo "Scheduled to run every day at ${COMMAND_START_TIME}"
+  if [ "${SLEEP_SECONDS}" != "86400" ]; then
+    echo "⚠️  COMMAND_INTERVAL is ignored because COMMAND_START_TIME is set"
+  fi
+else
+  echo "Interval set to ${SLEEP_SECONDS} seconds"
+fi
+
+# Seconds to wait until the next occurrence of COMMAND_START_TIME, computed again
+# before each run so that the duration of the command does not delay the next one
+seconds_until_start_time() {
+  local now start
+  now=$(date +%s)
+  start=$(date -d "${COMMAND_START_TIME}" +%s) || return 1
+  if [ "${start}" -le "${now}" ]; then
+    start=$((start + 86400))
+  fi
+  echo $((start - now))
+}
+
 while true; do
+  if [ -n "${COMMAND_START_TIME}" ]; then
+    WAIT_SECONDS=$(seconds_until_start_time)
+    # Never run the command back to back if the next run can't be computed
+    if ! [[ "${WAIT_SECONDS}" =~ ^[0-9]+$ ]] || [ "${WAIT_SECONDS}" -le 0 ]; then
+      echo "⚠️  Could not compute the next run time, waiting ${SLEEP_SECONDS} seconds"
+      WAIT_SECONDS=${SLEEP_SECONDS}
+    fi
+    sleep "${WAIT_SECONDS}s"
+  fi
   date
   /opt/peering-manager/venv/bin/python /opt/peering-manager/manage.py ${@}
-  sleep "${SLEEP_SECONDS}s"
+  if [ -z "${COMMAND_START_TIME}" ]; then
+    sleep "${SLEEP_SECONDS}s"
+  fi
 done